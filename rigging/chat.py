@@ -8,9 +8,9 @@ from __future__ import annotations
 
 import asyncio
 import typing as t
-from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime
+from itertools import chain
 from typing import runtime_checkable
 from uuid import UUID, uuid4
 
@@ -23,6 +23,7 @@ from rigging.generator.base import StopReason, Usage  # noqa: TCH001
 from rigging.message import Message, MessageDict, Messages
 from rigging.model import Model, ModelT, SystemErrorModel, ValidationErrorModel
 from rigging.tool import Tool, ToolCalls, ToolDescriptionList, ToolResult, ToolResults, system_tool_extension
+from rigging.util import fast_deepcopy
 
 if t.TYPE_CHECKING:
     from elasticsearch import AsyncElasticsearch
@@ -81,13 +82,21 @@ class Chat(BaseModel):
     This is typically used for graceful error handling when parsing.
     """
 
+    # (generator, params, identifier) from the last generator_id access,
+    # guarded by identity so swapping either recomputes.
+    _generator_id_cache: t.Optional[tuple[Generator, t.Optional[GenerateParams], str]] = None
+
     @computed_field(repr=False)  # type: ignore[misc]
     @property
     def generator_id(self) -> str | None:
         """The identifier of the generator used to create the chat"""
-        if self.generator is not None:
-            return self.generator.to_identifier(self.params)
-        return None
+        if self.generator is None:
+            return None
+        cached = self._generator_id_cache
+        if cached is None or cached[0] is not self.generator or cached[1] is not self.params:
+            cached = (self.generator, self.params, self.generator.to_identifier(self.params))
+            self._generator_id_cache = cached
+        return cached[2]
 
     def __init__(
         self,
@@ -118,11 +127,24 @@ class Chat(BaseModel):
         )
 
     def __len__(self) -> int:
-        return len(self.all)
+        return len(self.messages) + len(self.generated)
+
+    def __eq__(self, other: t.Any) -> bool:
+        # Chats carry whole message lists and comparisons are frequently
+        # against the same object (e.g. fluent methods returning self) -
+        # skip pydantic's full field walk for that case.
+        if self is other:
+            return True
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment] # mirrors pydantic's unhashable default
 
     @property
     def all(self) -> list[Message]:
         """Returns all messages in the chat, including the next messages."""
+        # Note: this allocates a fresh list per access - callers mutate
+        # messages in place, so don't cache it. Prefer iterating the
+        # underlying lists directly in internal hot paths.
         return self.messages + self.generated
 
     @property
@@ -138,12 +160,12 @@ class Chat(BaseModel):
     @property
     def last(self) -> Message:
         """Alias for .all[-1]"""
-        return self.all[-1]
+        return self.generated[-1] if self.generated else self.messages[-1]
 
     @property
     def conversation(self) -> str:
         """Returns a string representation of the chat."""
-        return "\n\n".join([str(m) for m in self.all])
+        return "\n\n".join(str(m) for m in chain(self.messages, self.generated))
 
     @property
     def message_dicts(self) -> list[MessageDict]:
@@ -153,7 +175,7 @@ class Chat(BaseModel):
         Returns:
             The MessageDict list
         """
-        return [t.cast(MessageDict, m.model_dump(include={"role", "content"})) for m in self.all]
+        return [m.to_dict() for m in chain(self.messages, self.generated)]
 
     def meta(self, **kwargs: t.Any) -> Chat:
         """
@@ -231,11 +253,11 @@ class Chat(BaseModel):
             self.generator,
         )
         if not only_messages:
-            new.metadata = deepcopy(self.metadata)
+            new.metadata = fast_deepcopy(self.metadata)
             new.params = self.params.model_copy() if self.params is not None else None
             new.stop_reason = self.stop_reason
             new.usage = self.usage.model_copy() if self.usage is not None else None
-            new.extra = deepcopy(self.extra)
+            new.extra = fast_deepcopy(self.extra)
             new.failed = self.failed
             new.error = self.error
         return new
@@ -453,12 +475,17 @@ class WatchChatCallback(t.Protocol):
 
 @dataclass
 class RunState:
+    # Slotted to keep per-state overhead down for large runs. All fields
+    # are required as class-level defaults would conflict with __slots__
+    # (slots=True needs py3.10+).
+    __slots__ = ("inputs", "messages", "params", "processor", "chat", "watched")
+
     inputs: list[Message]
     messages: list[Message]
     params: GenerateParams
     processor: t.Generator[list[Message], Message, list[Message]]
-    chat: Chat | None = None
-    watched: bool = False
+    chat: Chat | None
+    watched: bool
 
 
 class ChatPipeline:
@@ -633,7 +660,7 @@ class ChatPipeline:
             new.until_tools = self.until_tools.copy()
             new.inject_tool_prompt = self.inject_tool_prompt
             new.force_tool = self.force_tool
-            new.metadata = deepcopy(self.metadata)
+            new.metadata = fast_deepcopy(self.metadata)
             new.then_callbacks = self.then_callbacks.copy()
             new.map_callbacks = self.map_callbacks.copy()
             new.on_failed = self.on_failed
@@ -976,18 +1003,25 @@ class ChatPipeline:
         coros = [callback(chats) for callback in self.watch_callbacks]
         await asyncio.gather(*coros)
 
+    async def _then_chain(self, chat: Chat) -> Chat:
+        for then_callback in self.then_callbacks:
+            chat = (await then_callback(chat)) or chat
+        return chat
+
     async def _post_run(self, chats: list[Chat]) -> ChatList:
         # These have to be sequenced to support the concept of
         # a pipeline where future then/map calls can depend on
         # previous calls being ran.
+        #
+        # Map callbacks act as barriers since they need the full list,
+        # but then callbacks are per-chat and each chat can flow through
+        # the whole chain independently.
 
         for map_callback in self.map_callbacks:
             chats = await map_callback(chats)
 
-        for then_callback in self.then_callbacks:
-            coros = [then_callback(chat) for chat in chats]
-            new_chats = await asyncio.gather(*coros)
-            chats = [new or chat for new, chat in zip(new_chats, chats)]
+        if self.then_callbacks:
+            chats = list(await asyncio.gather(*[self._then_chain(chat) for chat in chats]))
 
         return ChatList(chats)
 
@@ -1007,7 +1041,12 @@ class ChatPipeline:
     def _fit_params(
         self, count: int, params: t.Sequence[t.Optional[GenerateParams] | None] | None = None
     ) -> list[GenerateParams]:
-        params = [None] * count if params is None else list(params)
+        if params is None:
+            # Every merge is identical here, so do it once and share the
+            # result - params are only read downstream.
+            merged = self.params if self.params is not None else GenerateParams()
+            return [merged] * count
+        params = list(params)
         if len(params) != count:
             raise ValueError(f"The number of params must be {count}")
         if self.params is not None:
@@ -1068,7 +1107,9 @@ class ChatPipeline:
             A list of generatated Chats.
         """
         on_failed = on_failed or self.on_failed
-        states: list[RunState] = [RunState([], [], p, self._process()) for p in self._fit_params(count, params)]
+        states: list[RunState] = [
+            RunState([], [], p, self._process(), None, False) for p in self._fit_params(count, params)
+        ]
         _ = [next(state.processor) for state in states]
 
         pending_states = states
@@ -1164,7 +1205,9 @@ class ChatPipeline:
         many = self._fit_many(count, many)
         params = self._fit_params(count, params)
 
-        states: list[RunState] = [RunState(self.chat.all + m, [], p, self._process()) for m, p in zip(many, params)]
+        states: list[RunState] = [
+            RunState(self.chat.all + m, [], p, self._process(), None, False) for m, p in zip(many, params)
+        ]
         _ = [next(state.processor) for state in states]
 
         pending_states = states
@@ -7,7 +7,6 @@ from __future__ import annotations
 import asyncio
 import string
 import typing as t
-from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime
 from typing import runtime_checkable
@@ -20,6 +19,7 @@ from rigging.error import CompletionExhaustedMaxRoundsError
 from rigging.generator import GenerateParams, Generator, get_generator
 from rigging.generator.base import StopReason, Usage  # noqa: TCH001
 from rigging.parsing import parse_many
+from rigging.util import fast_deepcopy
 
 if t.TYPE_CHECKING:
     from rigging.chat import FailMode
@@ -69,13 +69,21 @@ class Completion(BaseModel):
     This is typically used for graceful error handling when parsing.
     """
 
+    # (generator, params, identifier) from the last generator_id access,
+    # guarded by identity so swapping either recomputes.
+    _generator_id_cache: t.Optional[tuple[Generator, t.Optional[GenerateParams], str]] = None
+
     @computed_field(repr=False)  # type: ignore[misc]
     @property
     def generator_id(self) -> str | None:
         """The identifier of the generator used to create the completion"""
-        if self.generator is not None:
-            return self.generator.to_identifier(self.params)
-        return None
+        if self.generator is None:
+            return None
+        cached = self._generator_id_cache
+        if cached is None or cached[0] is not self.generator or cached[1] is not self.params:
+            cached = (self.generator, self.params, self.generator.to_identifier(self.params))
+            self._generator_id_cache = cached
+        return cached[2]
 
     def __init__(
         self,
@@ -152,13 +160,19 @@ class Completion(BaseModel):
 
     def clone(self, *, only_messages: bool = False) -> Completion:
         """Creates a deep copy of the completion."""
-        new = Completion(self.text, self.generated, self.generator)
+        # Validation already ran when this completion was created, so
+        # model_construct lets us skip it (and __init__) on the clone path.
+        new = Completion.model_construct(
+            text=self.text,
+            generated=self.generated,
+            generator=self.generator,
+        )
         if not only_messages:
-            new.metadata = deepcopy(self.metadata)
+            new.metadata = fast_deepcopy(self.metadata)
             new.stop_reason = self.stop_reason
-            new.usage = self.usage.model_copy() if self.usage is not None else self.usage
-            new.extra = deepcopy(self.extra)
-            new.params = self.params.model_copy() if self.params is not None else self.params
+            new.usage = self.usage.fast_copy() if self.usage is not None else self.usage
+            new.extra = fast_deepcopy(self.extra)
+            new.params = self.params.fast_copy() if self.params is not None else self.params
             new.failed = self.failed
         return new
 
@@ -221,11 +235,17 @@ class WatchCompletionCallback(t.Protocol):
 
 @dataclass
 class RunState:
+    # Slotted to keep per-state overhead down for large batch runs. All
+    # fields are required as class-level defaults would conflict with
+    # __slots__ (slots=True needs py3.10+).
+    __slots__ = ("text", "full_text", "params", "round", "completion", "watched")
+
     text: str
+    full_text: str  # text with any pipeline prefix already applied
     params: GenerateParams
-    processor: t.Generator[None, str, str]
-    completion: Completion | None = None
-    watched: bool = False
+    round: int
+    completion: Completion | None
+    watched: bool
 
 
 class CompletionPipeline:
@@ -261,10 +281,16 @@ class CompletionPipeline:
         # (callback, all_text, max_rounds)
         self.until_callbacks: list[tuple[UntilCompletionCallback, bool, int]] = []
         self.until_types: list[type[Model]] = []
+        # Opening-tag fragments derived from until_types, used as a cheap
+        # precheck before running the full parsers each round.
+        self._until_tag_probes: list[str] = []
+        self._parse_callback_registered: bool = False
         self.then_callbacks: list[ThenCompletionCallback] = []
         self.map_callbacks: list[MapCompletionCallback] = []
         self.watch_callbacks: list[WatchCompletionCallback] = watch_callbacks or []
 
+        self._template: string.Template | None = None
+
     def __len__(self) -> int:
         return len(self.text)
 
@@ -421,13 +447,22 @@ class CompletionPipeline:
         new = CompletionPipeline(
             self.generator,
             self.text,
-            params=self.params.model_copy() if self.params is not None else None,
+            params=self.params.fast_copy() if self.params is not None else None,
             watch_callbacks=self.watch_callbacks,
         )
         if not only_text:
-            new.until_callbacks = self.until_callbacks.copy()
+            # Rebind our parse callback to the clone so later
+            # until_parsed_as() additions on it are still enforced.
+            new.until_callbacks = [
+                (new._until_parse_callback, use_all_text, max_rounds)
+                if callback == self._until_parse_callback
+                else (callback, use_all_text, max_rounds)
+                for callback, use_all_text, max_rounds in self.until_callbacks
+            ]
             new.until_types = self.until_types.copy()
-            new.metadata = deepcopy(self.metadata)
+            new._until_tag_probes = self._until_tag_probes.copy()
+            new._parse_callback_registered = self._parse_callback_registered
+            new.metadata = fast_deepcopy(self.metadata)
             new.then_callbacks = self.then_callbacks.copy()
             new.map_callbacks = self.map_callbacks.copy()
         return new
@@ -459,8 +494,11 @@ class CompletionPipeline:
             A new instance of CompletionPipeline with the applied arguments.
         """
         new = self.clone()
-        template = string.Template(self.text)
-        new.text = template.safe_substitute(**kwargs)
+        # Templates re-scan the text when built, so keep ours around
+        # for repeated applies over the same text.
+        if self._template is None or self._template.template is not self.text:
+            self._template = string.Template(self.text)
+        new.text = self._template.safe_substitute(**kwargs)
         return new
 
     def until(
@@ -517,12 +555,18 @@ class CompletionPipeline:
             The updated CompletionPipeline object.
         """
         self.until_types += types
-        if next((c for c in self.until_callbacks if c[0] == self._until_parse_callback), None) is None:
+        self._until_tag_probes = [f"<{cls.__xml_tag__}" for cls in self.until_types]
+        if not self._parse_callback_registered:
             self.until_callbacks.append((self._until_parse_callback, use_all_text, max_rounds))
+            self._parse_callback_registered = True
 
         return self
 
     def _until_parse_callback(self, text: str) -> bool:
+        # A missing opening tag guarantees the parsers will fail, so check
+        # those with str.find before paying for the full regex scans.
+        if any(text.find(probe) == -1 for probe in self._until_tag_probes):
+            return True
         try:
             parse_many(text, *self.until_types)
         except Exception:
@@ -530,17 +574,27 @@ class CompletionPipeline:
         return False
 
     async def _watch_callback(self, completions: list[Completion]) -> None:
+        if not self.watch_callbacks:
+            # Even an empty gather() yields to the event loop once.
+            return
         coros = [callback(completions) for callback in self.watch_callbacks]
         await asyncio.gather(*coros)
 
+    async def _then_chain(self, completion: Completion) -> Completion:
+        for then_callback in self.then_callbacks:
+            completion = (await then_callback(completion)) or completion
+        return completion
+
     async def _post_run(self, completions: list[Completion]) -> list[Completion]:
+        # Map callbacks act as barriers since they need the full list.
         for map_callback in self.map_callbacks:
             completions = await map_callback(completions)
 
-        for then_callback in self.then_callbacks:
-            coros = [then_callback(chat) for chat in completions]
-            new_completions = await asyncio.gather(*coros)
-            completions = [new or chat for new, chat in zip(new_completions, completions)]
+        # Then callbacks are per-item, so let each completion flow through
+        # the entire chain independently instead of waiting on the slowest
+        # item at every stage.
+        if self.then_callbacks:
+            completions = list(await asyncio.gather(*[self._then_chain(c) for c in completions]))
 
         return completions
 
@@ -548,96 +602,77 @@ class CompletionPipeline:
     # until callbacks together, so here is the current implementation:
     #
     # - We take the lowest max_rounds from all until_callbacks
-    # - Each loop, we let every callback run, if any tell us to retry, we do
-    # - If we leave the loop with should_retry still True, we raise an error
-    # - Assuming every should_retry is False, we break out of the loop and return
+    # - Each round, we let every callback run, if any tell us to retry, we do
+    # - If we exhaust the rounds with should_retry still True, we raise an error
+    # - Assuming every should_retry is False, we return the generation
+
+    def _step(self, state: RunState, generated: str, lowest_max_rounds: int) -> str | None:
+        # Inline replacement for the old generator-based processor - apply
+        # the until callbacks directly and track rounds on the state,
+        # returning None when another round of generation is needed.
 
-    def _process(self) -> t.Generator[None, str, str]:
-        # If there are no until_callbacks, we can just yield the text
         if not self.until_callbacks:
-            generated = yield
             return generated
 
-        lowest_max_rounds = min((c[2] for c in self.until_callbacks), default=1)
+        state.round += 1
+        should_retry = False
+        for callback, use_all_text, _ in self.until_callbacks:
+            should_retry = callback(self.text + generated if use_all_text else generated)
+            if should_retry:
+                continue
 
-        current_round = 0
-        should_retry = True
-        while should_retry and current_round < lowest_max_rounds:
-            current_round += 1
-            generated = yield
-            for callback, use_all_text, _ in self.until_callbacks:
-                should_retry = callback(self.text + generated if use_all_text else generated)
-                if should_retry:
-                    continue
+        if not should_retry:
+            return generated
 
-        if should_retry:
-            logger.warning(f"Exhausted lowest max rounds ({lowest_max_rounds})")
-            raise CompletionExhaustedMaxRoundsError(lowest_max_rounds, generated)
+        if state.round < lowest_max_rounds:
+            return None
 
-        return generated
+        logger.warning(f"Exhausted lowest max rounds ({lowest_max_rounds})")
+        raise CompletionExhaustedMaxRoundsError(lowest_max_rounds, generated)
 
     def _fit_params(
         self, count: int, params: t.Sequence[t.Optional[GenerateParams] | None] | None = None
     ) -> list[GenerateParams]:
-        params = [None] * count if params is None else list(params)
+        if params is None:
+            # Every merge is identical here, so do it once and share the
+            # result - params are only read downstream.
+            merged = self.params if self.params is not None else GenerateParams()
+            return [merged] * count
+        params = list(params)
         if len(params) != count:
             raise ValueError(f"The number of params must be {count}")
         if self.params is not None:
             params = [self.params.merge_with(p) for p in params]
         return [(p or GenerateParams()) for p in params]
 
-    async def run(self, *, allow_failed: bool = False) -> Completion:
-        """
-        Execute the generation process to produce the final completion.
-
-        Returns:
-            The generated Completion.
-        """
-        completions = await self.run_many(1, on_failed="include" if allow_failed else "raise")
-        return completions[0]
-
-    __call__ = run
-
-    # Many messages
-
-    async def run_many(
-        self,
-        count: int,
-        *,
-        params: t.Sequence[t.Optional[GenerateParams]] | None = None,
-        on_failed: FailMode | None = None,
-    ) -> list[Completion]:
-        """
-        Executes the generation process multiple times with the same inputs.
-
-        Parameters:
-            count: The number of times to execute the generation process.
-            params: A sequence of parameters to be used for each execution.
-            on_failed: How to handle failures in the pipeline unless overriden in calls.
+    async def _stream(self, states: list[RunState], on_failed: FailMode) -> t.AsyncGenerator[Completion, None]:
+        # Core generation loop which yields each completion the moment its
+        # processor finishes, rather than waiting on the whole set.
 
-        Returns:
-            A list of generatated Completions.
-        """
-        on_failed = on_failed or self.on_failed
-        states: list[RunState] = [RunState(self.text, p, self._process()) for p in self._fit_params(count, params)]
-        _ = [next(state.processor) for state in states]
+        lowest_max_rounds = min((c[2] for c in self.until_callbacks), default=1)
 
         pending_states = states
         while pending_states:
             inbounds = await self.generator.generate_texts(
-                [s.text for s in pending_states], [s.params for s in pending_states]
+                [s.full_text for s in pending_states], [s.params for s in pending_states]
             )
 
+            # Track state transitions directly as we process the round
+            # instead of re-scanning the full state lists afterwards.
+            still_pending: list[RunState] = []
+            just_finished: list[RunState] = []
+
             for inbound, state in zip(inbounds, pending_states):
                 output: str = ""
                 failed: bool = False
                 error: Exception | None = None
 
                 try:
-                    state.processor.send(inbound.text)
-                    continue
-                except StopIteration as stop:
-                    output = t.cast(str, stop.value)
+                    stepped = self._step(state, inbound.text, lowest_max_rounds)
+                    if stepped is None:
+                        still_pending.append(state)
+                        continue
+                    output = stepped
                 except CompletionExhaustedMaxRoundsError as exhausted:
                     if on_failed == "raise":
                         raise
@@ -650,33 +685,87 @@ class CompletionPipeline:
                     failed = True
                     error = e
 
-                state.completion = Completion(
-                    self.text,
-                    output,
+                # Trusted internal construction - all of these values were
+                # validated on their way in, so skip pydantic validation.
+                state.completion = Completion.model_construct(
+                    text=self.text,
+                    generated=output,
                     generator=self.generator,
                     params=state.params,
-                    metadata=self.metadata,
+                    metadata=fast_deepcopy(self.metadata),
                     stop_reason=inbound.stop_reason,
                     usage=inbound.usage,
                     extra=inbound.extra,
                     failed=failed,
                     error=error,
                 )
+                just_finished.append(state)
 
-            pending_states = [s for s in pending_states if s.completion is None]
-            to_watch_states = [s for s in states if s.completion is not None and not s.watched]
+            pending_states = still_pending
 
-            await self._watch_callback([s.completion for s in to_watch_states if s.completion is not None])
+            if self.watch_callbacks:
+                await self._watch_callback([s.completion for s in just_finished if s.completion is not None])
 
-            for state in to_watch_states:
+            for state in just_finished:
                 state.watched = True
+                if state.completion is not None:
+                    yield state.completion
 
+    def _finalize(self, states: list[RunState], on_failed: FailMode) -> list[Completion]:
+        # Read results back in input order - they stream out of
+        # _stream in completion order.
         if on_failed == "skip":
-            completions = [s.completion for s in states if s.completion is not None and not s.completion.failed]
-        else:
-            completions = [s.completion for s in states if s.completion is not None]
+            return [s.completion for s in states if s.completion is not None and not s.completion.failed]
+        return [s.completion for s in states if s.completion is not None]
+
+    async def run(self, *, allow_failed: bool = False) -> Completion:
+        """
+        Execute the generation process to produce the final completion.
+
+        Returns:
+            The generated Completion.
+        """
+        # Single completion - drive one state through the stream directly
+        # instead of paying for the run_many list machinery.
+        on_failed: FailMode = "include" if allow_failed else "raise"
+        state = RunState(self.text, self.text, self._fit_params(1)[0], 0, None, False)
+
+        async for _completion in self._stream([state], on_failed):
+            pass
+
+        return (await self._post_run([t.cast(Completion, state.completion)]))[0]
+
+    __call__ = run
+
+    # Many messages
 
-        return await self._post_run(completions)
+    async def run_many(
+        self,
+        count: int,
+        *,
+        params: t.Sequence[t.Optional[GenerateParams]] | None = None,
+        on_failed: FailMode | None = None,
+    ) -> list[Completion]:
+        """
+        Executes the generation process multiple times with the same inputs.
+
+        Parameters:
+            count: The number of times to execute the generation process.
+            params: A sequence of parameters to be used for each execution.
+            on_failed: How to handle failures in the pipeline unless overriden in calls.
+
+        Returns:
+            A list of generatated Completions.
+        """
+        on_failed = on_failed or self.on_failed
+        states: list[RunState] = [
+            RunState(self.text, self.text, p, 0, None, False) for p in self._fit_params(count, params)
+        ]
+
+        async for _completion in self._stream(states, on_failed):
+            pass
+
+        return await self._post_run(self._finalize(states, on_failed))
 
     # Batch completions
 
@@ -703,65 +792,12 @@ class CompletionPipeline:
         """
         on_failed = on_failed or self.on_failed
         params = self._fit_params(len(many), params)
-        states: list[RunState] = [RunState(m, p, self._process()) for m, p in zip(many, params)]
-        _ = [next(state.processor) for state in states]
-
-        pending_states = states
-        while pending_states:
-            inbounds = await self.generator.generate_texts(
-                [self.text + s.text for s in pending_states],
-                [s.params for s in pending_states],
-            )
-
-            for inbound, state in zip(inbounds, pending_states):
-                output: str = ""
-                failed: bool = False
-                error: Exception | None = None
-
-                try:
-                    state.processor.send(inbound.text)
-                    continue
-                except StopIteration as stop:
-                    output = t.cast(str, stop.value)
-                except CompletionExhaustedMaxRoundsError as exhausted:
-                    if on_failed == "raise":
-                        raise
-                    output = exhausted.completion
-                    failed = True
-                    error = exhausted
-                except Exception as e:
-                    if on_failed == "raise" or not any(isinstance(e, t) for t in self.errors_to_fail_on):
-                        raise
-                    failed = True
-                    error = e
+        states: list[RunState] = [RunState(m, self.text + m, p, 0, None, False) for m, p in zip(many, params)]
 
-                state.completion = Completion(
-                    self.text,
-                    output,
-                    generator=self.generator,
-                    params=state.params,
-                    metadata=self.metadata,
-                    stop_reason=inbound.stop_reason,
-                    usage=inbound.usage,
-                    extra=inbound.extra,
-                    failed=failed,
-                    error=error,
-                )
-
-            pending_states = [s for s in pending_states if s.completion is None]
-            to_watch_states = [s for s in states if s.completion is not None and not s.watched]
-
-            await self._watch_callback([s.completion for s in to_watch_states if s.completion is not None])
-
-            for state in to_watch_states:
-                state.watched = True
-
-        if on_failed == "skip":
-            completions = [s.completion for s in states if s.completion is not None and not s.completion.failed]
-        else:
-            completions = [s.completion for s in states if s.completion is not None]
+        async for _completion in self._stream(states, on_failed):
+            pass
 
-        return await self._post_run(completions)
+        return await self._post_run(self._finalize(states, on_failed))
 
     # Generator iteration
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import inspect
 import typing as t
 
@@ -29,6 +30,21 @@ class LazyGenerator(t.Protocol):
 g_providers: dict[str, type[Generator] | LazyGenerator] = {}
 
 
+ModelT = t.TypeVar("ModelT", bound=BaseModel)
+
+
+def _fast_copy(model: ModelT) -> ModelT:
+    # Shallow copy that sidesteps pydantic's model_copy machinery - only
+    # safe for flat structs treated as immutable by convention.
+    cls = type(model)
+    new = cls.__new__(cls)
+    object.__setattr__(new, "__dict__", model.__dict__.copy())
+    object.__setattr__(new, "__pydantic_extra__", model.__pydantic_extra__)
+    object.__setattr__(new, "__pydantic_private__", model.__pydantic_private__)
+    object.__setattr__(new, "__pydantic_fields_set__", set(model.__pydantic_fields_set__))
+    return new
+
+
 # TODO: We also would like to support N-style
 # parallel generation eventually -> need to
 # update our interfaces to support that
@@ -102,12 +118,11 @@ class GenerateParams(BaseModel):
         if len(others) == 0 or all(p is None for p in others):
             return self
 
+        # exclude_none matches the old per-field None filter, but keeps
+        # the whole dump on pydantic's C serialization path.
         updates: dict[str, t.Any] = {}
         for other in [o for o in others if o is not None]:
-            other_dict = other.model_dump(exclude_unset=True)
-            for name, value in other_dict.items():
-                if value is not None:
-                    updates[name] = value
+            updates.update(other.model_dump(exclude_unset=True, exclude_none=True))
 
         return self.model_copy(update=updates)
 
@@ -123,6 +138,19 @@ class GenerateParams(BaseModel):
             params.update(params.pop("extra"))
         return params
 
+    def fast_copy(self) -> GenerateParams:
+        """
+        Shallow, validation-free copy for hot clone paths.
+
+        Note:
+            Unlike `model_copy`, nested containers (`stop`, `extra`) stay
+            shared with the original - treat the copy as read-only.
+
+        Returns:
+            A shallow copy of the parameters.
+        """
+        return _fast_copy(self)
+
 
 StopReason = t.Literal["stop", "length", "content_filter", "unknown"]
 """Reporting reason for generation completing."""
@@ -148,6 +176,15 @@ class Usage(BaseModel):
     total_tokens: int
     """The total number of tokens processed."""
 
+    def fast_copy(self) -> Usage:
+        """
+        Shallow, validation-free copy for hot clone paths.
+
+        Returns:
+            A shallow copy of the usage statistics.
+        """
+        return _fast_copy(self)
+
 
 GeneratedT = t.TypeVar("GeneratedT", Message, str)
 
@@ -532,6 +569,27 @@ def get_generator(identifier: str, *, params: GenerateParams | None = None) -> G
         InvalidModelSpecified: If the identifier is invalid.
     """
 
+    generator_cls, model, init_kwargs, param_kwargs = _parse_identifier(identifier)
+
+    try:
+        merged_params = GenerateParams(**dict(param_kwargs)).merge_with(params)
+    except Exception as e:
+        raise InvalidModelSpecifiedError(identifier) from e
+
+    return generator_cls(model=model, params=merged_params, **dict(init_kwargs))
+
+
+# Identifier parsing involves string splitting, signature inspection, and
+# type conversion which never change for a given identifier - cache the
+# derived pieces and leave generator construction (mutable state like
+# watch callbacks) to every get_generator call. Generators themselves are
+# deliberately not cached.
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_identifier(
+    identifier: str,
+) -> tuple[type[Generator], str, tuple[tuple[str, t.Any], ...], tuple[tuple[str, str], ...]]:
     provider: str = list(g_providers.keys())[0]
     model: str = identifier
 
@@ -581,12 +639,7 @@ def get_generator(identifier: str, *, params: GenerateParams | None = None) -> G
         if isinstance(v, str) and v.lower() in ["true", "false"]:
             init_kwargs[k] = v.lower() == "true"
 
-    try:
-        merged_params = GenerateParams(**kwargs).merge_with(params)
-    except Exception as e:
-        raise InvalidModelSpecifiedError(identifier) from e
-
-    return generator_cls(model=model, params=merged_params, **init_kwargs)
+    return generator_cls, model, tuple(init_kwargs.items()), tuple(kwargs.items())
 
 
 def register_generator(provider: str, generator_cls: type[Generator] | LazyGenerator) -> None:
@@ -601,6 +654,7 @@ def register_generator(provider: str, generator_cls: type[Generator] | LazyGener
     """
     global g_providers
     g_providers[provider] = generator_cls
+    _parse_identifier.cache_clear()
 
 
 def trace_messages(messages: t.Sequence[Message] | t.Sequence[GeneratedMessage], title: str) -> None:
@@ -135,7 +135,7 @@ class TransformersGenerator(Generator):
 
     def _generate(
         self,
-        inputs: t.Sequence[str] | t.Sequence[t.Sequence[dict[str, str]]],
+        inputs: t.Sequence[str] | t.Sequence[t.Sequence[t.Mapping[str, t.Any]]],
         params: t.Sequence[GenerateParams],
     ) -> list[GeneratedText]:
         param_set = {p.model_dump_json() for p in params}
@@ -163,7 +163,7 @@ class TransformersGenerator(Generator):
         messages: t.Sequence[t.Sequence[Message]],
         params: t.Sequence[GenerateParams],
     ) -> t.Sequence[GeneratedMessage]:
-        message_dicts = [[m.model_dump(include={"role", "content"}) for m in _messages] for _messages in messages]
+        message_dicts = [[m.to_dict() for m in _messages] for _messages in messages]
         outputs = self._generate(message_dicts, params)
         generated = [o.to_generated_message() for o in outputs]
 
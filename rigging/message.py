@@ -5,7 +5,9 @@ This module covers core message objects and handling.
 from __future__ import annotations
 
 import copy
+import functools
 import string
+import sys
 import typing as t
 from textwrap import dedent
 from uuid import UUID, uuid4
@@ -31,6 +33,27 @@ if t.TYPE_CHECKING:
 Role = t.Literal["system", "user", "assistant"]
 """The role of a message. Can be 'system', 'user', or 'assistant'."""
 
+# Canonical interned instances of the valid roles - sharing these makes
+# role comparisons and dict builds pointer-cheap across many messages.
+_INTERNED_ROLES = {role: sys.intern(role) for role in t.get_args(Role)}
+
+
+def _dedent(content: str) -> str:
+    # Most content is a single, already-flush line where dedent() is an
+    # expensive no-op - only pay for the line scan when the content has
+    # newlines or leading whitespace to strip. Not lru-cached on purpose:
+    # generated content is unique per call and would thrash the cache.
+    if "\n" not in content and (not content or not content[0].isspace()):
+        return content
+    return dedent(content)
+
+
+@functools.lru_cache(maxsize=512)
+def _template_for(content: str) -> string.Template:
+    # Template parsing is pure per content string, and apply() is often
+    # called repeatedly over the same prompt templates.
+    return string.Template(content)
+
 
 # Helper type for messages structured
 # more similarly to other libraries
@@ -87,12 +110,26 @@ class Message(BaseModel):
 
     _content: str = ""
 
+    # Parse results keyed on (content, types, fail_on_missing) - results
+    # only depend on the content string, so entries stay valid until the
+    # content changes and the key no longer matches.
+    _parse_cache: dict[tuple[t.Any, ...], list[tuple[t.Any, slice]]] = {}
+
+    # (content, role, rendered) from the last __str__ call - guarded by
+    # content identity so the internal _content assignments (which skip
+    # the setter) still invalidate naturally.
+    _str_cache: t.Optional[tuple[str, str, str]] = None
+
     def __init__(self, role: Role, content: str, parts: t.Sequence[ParsedMessagePart] | None = None, **kwargs: t.Any):
         super().__init__(role=role, parts=parts or [], **kwargs)
-        self._content = dedent(content)
+        self._content = _dedent(content)
 
     def __str__(self) -> str:
-        return f"[{self.role}]: {self.content}"
+        cached = self._str_cache
+        if cached is None or cached[0] is not self._content or cached[1] != self.role:
+            cached = (self._content, self.role, f"[{self.role}]: {self._content}")
+            self._str_cache = cached
+        return cached[2]
 
     def __len__(self) -> int:
         return len(self.content)
@@ -112,8 +149,17 @@ class Message(BaseModel):
         # tracking parsed parts makes this more complicated
         # so fow now I've opted to strip all parts
         # when content is changed.
-        self.parts = []
-        self._content = dedent(value)
+        if self.parts:
+            self.parts = []
+        self._parse_cache.clear()
+        self._content = _dedent(value)
+
+    @field_validator("role", mode="before")
+    @classmethod
+    def validate_role(cls, value: t.Any) -> t.Any:
+        if isinstance(value, str):
+            return _INTERNED_ROLES.get(value, value)
+        return value
 
     @model_validator(mode="after")
     def validate_parts(self) -> Message:
@@ -188,6 +234,15 @@ class Message(BaseModel):
 
         self.parts = sorted(self.parts, key=lambda p: p.slice_.start)
 
+    def to_dict(self) -> MessageDict:
+        """
+        Returns the message as a minimal role/content dictionary.
+
+        This is much cheaper than `model_dump` for the common case of
+        handing messages to an underlying API.
+        """
+        return {"role": self.role, "content": self._content}
+
     def clone(self) -> Message:
         """Creates a copy of the message."""
         return Message(self.role, self.content, parts=copy.deepcopy(self.parts))
@@ -204,10 +259,9 @@ class Message(BaseModel):
         Args:
             **kwargs: Keyword arguments to substitute in the message content.
         """
-        new = self.clone()
-        template = string.Template(new.content)
-        new.content = template.safe_substitute(**kwargs)
-        return new
+        # No need to clone first - assigning substituted content would
+        # strip any cloned parts anyway, so build the result directly.
+        return Message(self.role, _template_for(self.content).safe_substitute(**kwargs))
 
     def strip(self, model_type: type[Model], *, fail_on_missing: bool = False) -> list[ParsedMessagePart]:
         """
@@ -224,13 +278,37 @@ class Message(BaseModel):
             TypeError: If no matching model is found and fail_on_missing is True.
         """
         removed: list[ParsedMessagePart] = []
-        for part in self.parts[:]:
-            if isinstance(part.model, model_type):
-                self._remove_part(part)
-                removed.append(part)
-
-        if not removed and fail_on_missing:
-            raise TypeError(f"Could not find <{model_type.__xml_tag__}> ({model_type.__name__}) in message")
+        kept: list[ParsedMessagePart] = []
+        for part in self.parts:
+            (removed if isinstance(part.model, model_type) else kept).append(part)
+
+        if not removed:
+            if fail_on_missing:
+                raise TypeError(f"Could not find <{model_type.__xml_tag__}> ({model_type.__name__}) in message")
+            return removed
+
+        # Part slices never overlap (_add_part enforces this), so rather
+        # than rebuilding the content string per removed part we can walk
+        # the removals in order, join the surviving gaps once, and shift
+        # each kept slice by the removed length that precedes it.
+        removed_in_order = sorted(removed, key=lambda p: p.slice_.start)
+
+        pieces: list[str] = []
+        cursor = 0
+        for part in removed_in_order:
+            pieces.append(self._content[cursor : part.slice_.start])
+            cursor = part.slice_.stop
+        pieces.append(self._content[cursor:])
+
+        for part in kept:
+            shift = sum(
+                r.slice_.stop - r.slice_.start for r in removed_in_order if r.slice_.start < part.slice_.start
+            )
+            if shift:
+                part.slice_ = slice(part.slice_.start - shift, part.slice_.stop - shift)
+
+        self.parts = kept
+        self._content = "".join(pieces)
 
         return removed
 
@@ -268,6 +346,10 @@ class Message(BaseModel):
         Returns:
             The first model that matches the given model type, or None if no match is found.
         """
+        # Without the opening tag the scan can't succeed - str.find
+        # proves a miss far cheaper than the regex engine can.
+        if self._content.find(f"<{model_type.__xml_tag__}") == -1:
+            return None
         return next(iter(self.try_parse_many(model_type)), None)
 
     def parse_set(self, model_type: type[ModelT], minimum: int | None = None) -> list[ModelT]:
@@ -303,6 +385,10 @@ class Message(BaseModel):
         Raises:
             MissingModelError: If the number of parsed models is less than the minimum required.
         """
+        # Opening-tag occurrences bound the possible match count from
+        # above, letting us fail fast before any real parsing.
+        if minimum is not None and self._content.count(f"<{model_type.__xml_tag__}") < minimum:
+            raise MissingModelError(f"Expected at least {minimum} {model_type.__name__} in message")
         models = self.try_parse_many(model_type, fail_on_missing=fail_on_missing)
         if minimum is not None and len(models) < minimum:
             raise MissingModelError(f"Expected at least {minimum} {model_type.__name__} in message")
@@ -337,8 +423,14 @@ class Message(BaseModel):
         Raises:
             MissingModelError: If a model type is missing and `fail_on_missing` is True.
         """
-        model: ModelT
-        parsed: list[tuple[ModelT, slice]] = try_parse_many(self.content, *types, fail_on_missing=fail_on_missing)
+        # Repeat parses over unchanged content are common (e.g. parse()
+        # then parse_set() on the same message) - reuse the prior result
+        # and let _add_part dedupe, skipping the regex work entirely.
+        key = (self._content, types, fail_on_missing)
+        parsed: list[tuple[ModelT, slice]] | None = self._parse_cache.get(key)
+        if parsed is None:
+            parsed = try_parse_many(self._content, *types, fail_on_missing=fail_on_missing)
+            self._parse_cache[key] = parsed
         for model, slice_ in parsed:
             self._add_part(ParsedMessagePart(model=model, slice_=slice_))
         self._sync_parts()
@@ -379,14 +471,29 @@ class Message(BaseModel):
         """Helper function to convert various common types to a strict list of Message objects."""
         if isinstance(messages, (Message, dict, str)):
             return [cls.fit(messages)]
-        return [cls.fit(message) for message in messages]
+        fit = cls.fit
+        return [fit(message) for message in messages]
 
     @classmethod
     def fit(cls, message: t.Union[Message, MessageDict, str]) -> Message:
         """Helper function to convert various common types to a Message object."""
-        if isinstance(message, str):
+        # Exact-type checks first - they cover virtually every call and
+        # skip the isinstance walks; subclassed inputs fall through to
+        # the original handling below.
+        if type(message) is str:
             return cls(role="user", content=message)
-        return cls(**message) if isinstance(message, dict) else message.model_copy(deep=True)
+        if type(message) is dict:
+            return cls(**message)
+        if type(message) is not Message:
+            if isinstance(message, str):
+                return cls(role="user", content=message)
+            if isinstance(message, dict):
+                return cls(**message)
+        # Copy the part wrappers (their slices get reassigned during
+        # syncs) but share the content string and parsed model instances
+        # with the source - much cheaper than a full deep copy when
+        # continuing or forking long chats.
+        return message.model_copy(update={"parts": [part.model_copy() for part in message.parts]})
 
     @classmethod
     def apply_to_list(cls, messages: t.Sequence[Message], **kwargs: str) -> list[Message]:
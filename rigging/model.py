@@ -4,6 +4,7 @@ Models are the core datatypes for structured parsing.
 
 from __future__ import annotations
 
+import functools
 import re
 import typing as t
 from xml.etree import ElementTree as ET
@@ -41,6 +42,61 @@ ModelT = t.TypeVar("ModelT", bound="Model")
 
 BASIC_TYPES = [int, str, float, bool]
 
+# Shared by all models - matches are filtered by tag afterwards. Compiled
+# once here so the hot parsing paths skip the regex cache lookup. The
+# bytes variant backs the ASCII fast path in _scan_tags below.
+TAG_PATTERN = re.compile(r"(<([\w-]+).*?>((.*?)</\2>))", flags=re.DOTALL)
+TAG_PATTERN_BYTES = re.compile(rb"(<([\w-]+).*?>((.*?)</\2>))", flags=re.DOTALL)
+
+
+class _TagMatch(t.NamedTuple):
+    # Normalized str-only view of a tag regex match so consumers don't
+    # care whether the scan ran over str or bytes.
+    full: str
+    tag: str
+    inner_with_end: str
+    inner: str
+    start: int
+    stop: int
+
+
+def _scan_tags(content: str) -> list[_TagMatch]:
+    # ASCII content - the overwhelmingly common case for model tags - can
+    # be scanned as bytes, where the regex engine skips its unicode
+    # codepoint handling, and byte offsets map 1:1 onto the string.
+    if content.isascii():
+        return [
+            _TagMatch(
+                m.group(1).decode("ascii"),
+                m.group(2).decode("ascii"),
+                m.group(3).decode("ascii"),
+                m.group(4).decode("ascii"),
+                m.start(),
+                m.end(),
+            )
+            for m in TAG_PATTERN_BYTES.finditer(content.encode("ascii"))
+        ]
+    return [
+        _TagMatch(m.group(1), m.group(2), m.group(3), m.group(4), m.start(), m.end())
+        for m in TAG_PATTERN.finditer(content)
+    ]
+
+
+@functools.cache
+def _simple_field(cls: type[Model]) -> str | None:
+    # Field introspection is surprisingly costly to repeat per parsed
+    # match, and the answer never changes for a class - cache the name
+    # of the single basic-typed field ("simple" models), or None.
+    field_values = list(cls.model_fields.values())
+    if len(field_values) != 1:
+        return None
+
+    annotation = field_values[0].annotation
+    if t.get_origin(annotation) == t.Annotated:
+        annotation = t.get_args(annotation)[0]
+
+    return next(iter(cls.model_fields)) if annotation in BASIC_TYPES else None
+
 
 class XmlTagDescriptor:
     def __get__(self, _: t.Any, owner: t.Any) -> str:
@@ -123,15 +179,7 @@ class Model(BaseXmlModel):
         Returns:
             True if the model is simple, False otherwise.
         """
-        field_values = list(cls.model_fields.values())
-        if len(field_values) != 1:
-            return False
-
-        annotation = field_values[0].annotation
-        if t.get_origin(annotation) == t.Annotated:
-            annotation = t.get_args(annotation)[0]
-
-        return annotation in BASIC_TYPES
+        return _simple_field(cls) is not None
 
     @classmethod
     def xml_start_tag(cls) -> str:
@@ -208,10 +256,14 @@ class Model(BaseXmlModel):
             MissingModelError: If the specified model tags are not found in the message.
             ValidationError: If an error occurs while parsing the content.
         """
-        cls.ensure_valid()
+        matches = [m for m in _scan_tags(content) if m.tag == cls.__xml_tag__]
+        return cls._from_matches(matches)
 
-        pattern = r"(<([\w-]+).*?>((.*?)</\2>))"
-        matches = [m for m in re.finditer(pattern, content, flags=re.DOTALL) if m.group(2) == cls.__xml_tag__]
+    @classmethod
+    def _from_matches(cls, matches: list[_TagMatch]) -> list[tuple[ModelT, slice]]:
+        # Shared tail of from_text() - callers like parse_many() scan the
+        # content once and hand each class its own bucket of tag matches.
+        cls.ensure_valid()
 
         if not matches:
             raise MissingModelError(f"Failed to find '{cls.xml_tags()}' in message")
@@ -219,12 +271,14 @@ class Model(BaseXmlModel):
         # Sort matches_with_tag based on the length of the interior text,
         # longest first. This should help us avoid matching the model
         # supplying hollow tags before the actual data.
-        sorted_matches = sorted(matches, key=lambda m: len(m.group(4)), reverse=True)
+        sorted_matches = sorted(matches, key=lambda m: len(m.inner), reverse=True)
+
+        simple_field = _simple_field(cls)
 
         extracted: list[tuple[ModelT, slice]] = []
         exceptions: list[Exception] = []
         for match in sorted_matches:
-            full_text, _, inner_with_end_tag, inner = match.groups()
+            full_text, inner_with_end_tag, inner = match.full, match.inner_with_end, match.inner
 
             # The model might trip up regex by including partial tags
             # in passing before actually using them. We'll continually try
@@ -235,20 +289,24 @@ class Model(BaseXmlModel):
             # TODO: The opposite could be true, and we could greedily parse
             # backwards if we get failures. This is a simple solution for now.
 
-            inner_match: re.Match[str] | None = match
+            inner_match: _TagMatch | None = match
             while inner_match is not None:
-                inner_matches = re.finditer(pattern, inner_with_end_tag, flags=re.DOTALL)
-                inner_match = next((m for m in inner_matches if m.group(2) == cls.__xml_tag__), None)
+                inner_matches = _scan_tags(inner_with_end_tag)
+                inner_match = next((m for m in inner_matches if m.tag == cls.__xml_tag__), None)
                 if inner_match is not None:
-                    full_text, _, inner_with_end_tag, inner = inner_match.groups()
+                    full_text, inner_with_end_tag, inner = (
+                        inner_match.full,
+                        inner_match.inner_with_end,
+                        inner_match.inner,
+                    )
 
             try:
                 model = (
-                    cls(**{next(iter(cls.model_fields)): unescape_xml(inner)})
-                    if cls.is_simple()
+                    cls(**{simple_field: unescape_xml(inner)})
+                    if simple_field is not None
                     else cls.from_xml(escape_xml(full_text))
                 )
-                extracted.append((model, slice(match.start(), match.end())))  # type: ignore [arg-type]
+                extracted.append((model, slice(match.start, match.stop)))  # type: ignore [arg-type]
             except Exception as e:
                 exceptions.append(e)
                 continue
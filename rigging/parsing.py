@@ -7,9 +7,10 @@ from __future__ import annotations
 import typing as t
 
 from rigging.error import MissingModelError
+from rigging.model import _scan_tags
 
 if t.TYPE_CHECKING:
-    from rigging.model import ModelT
+    from rigging.model import ModelT, _TagMatch
 
 
 def parse(text: str, model_type: type[ModelT]) -> tuple[ModelT, slice]:
@@ -117,12 +118,16 @@ def try_parse_many(text: str, *types: type[ModelT], fail_on_missing: bool = Fals
     Raises:
         MissingModelError: If a model type is missing and `fail_on_missing` is True.
     """
-    model: ModelT
+    # One scan of the text serves every requested type - bucket the
+    # generic tag matches and let each model consume its own group.
+    buckets: dict[str, list[_TagMatch]] = {}
+    for match in _scan_tags(text):
+        buckets.setdefault(match.tag, []).append(match)
+
     parsed: list[tuple[ModelT, slice]] = []
     for model_class in types:
         try:
-            for model, slice_ in model_class.from_text(text):
-                parsed.append((model, slice_))
+            parsed.extend(model_class._from_matches(buckets.get(t.cast(str, model_class.__xml_tag__), [])))
         except MissingModelError as e:
             if fail_on_missing:
                 raise e
@@ -29,6 +29,8 @@ DEFAULT_DOC = "Convert the following inputs to outputs ({func_name})."
 DEFAULT_MAX_ROUNDS = 3
 """Default maximum number of rounds for a prompt to run until outputs are parsed."""
 
+_WHITESPACE_PATTERN = re.compile(r"(?![\r\n])(\b\s+)")
+
 
 P = ParamSpec("P")
 R = t.TypeVar("R")
@@ -454,7 +456,7 @@ class Prompt(t.Generic[P, R]):
         # Guidance is taken from https://github.com/outlines-dev/outlines/blob/main/outlines/prompts.py
         docstring = self.func.__doc__ or DEFAULT_DOC.format(func_name=self.func.__name__)
         docstring = inspect.cleandoc(docstring)
-        docstring = re.sub(r"(?![\r\n])(\b\s+)", " ", docstring)
+        docstring = _WHITESPACE_PATTERN.sub(" ", docstring)
         return docstring
 
     @property
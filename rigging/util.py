@@ -3,12 +3,34 @@ from __future__ import annotations
 import asyncio
 import re
 import typing as t
+from copy import deepcopy
 from threading import Thread
 
 from pydantic import alias_generators
 
 R = t.TypeVar("R")
 
+# Copy utilities
+
+_PRIMITIVE_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+def fast_deepcopy(source: dict[str, t.Any]) -> dict[str, t.Any]:
+    # Metadata and extra dicts are almost always flat primitives,
+    # which copy.deepcopy handles slowly through reflective dispatch.
+    # Shortcut the common cases and only fall back when we have to.
+    copied: dict[str, t.Any] = {}
+    for key, value in source.items():
+        if isinstance(value, _PRIMITIVE_TYPES):
+            copied[key] = value
+        elif type(value) is list and all(isinstance(v, _PRIMITIVE_TYPES) for v in value):
+            copied[key] = value.copy()
+        elif type(value) is dict and all(isinstance(v, _PRIMITIVE_TYPES) for v in value.values()):
+            copied[key] = value.copy()
+        else:
+            copied[key] = deepcopy(value)
+    return copied
+
 # Async utilities
 #
 # TODO: Should this be a global? Is that safe with multiple threads?
@@ -65,23 +87,25 @@ def await_(*coros: t.Coroutine[t.Any, t.Any, R]) -> R | list[R]:  # type: ignore
 
 # XML Formatting
 
+_ESCAPE_XML_PATTERN = re.compile(r"&(?!(?:amp|lt|gt|apos|quot);)")
+
 
 def escape_xml(xml_string: str) -> str:
     """Escape XML special characters in a string."""
-    prepared = re.sub(r"&(?!(?:amp|lt|gt|apos|quot);)", "&amp;", xml_string)
-
-    return prepared
+    return _ESCAPE_XML_PATTERN.sub("&amp;", xml_string)
 
 
 def unescape_xml(xml_string: str) -> str:
     """Unescape XML special characters in a string."""
-    unescaped = re.sub(r"&amp;", "&", xml_string)
-    unescaped = re.sub(r"&lt;", "<", unescaped)
-    unescaped = re.sub(r"&gt;", ">", unescaped)
-    unescaped = re.sub(r"&apos;", "'", unescaped)
-    unescaped = re.sub(r"&quot;", '"', unescaped)
-
-    return unescaped
+    # These are all literal substitutions, so sequential str.replace
+    # calls beat the regex engine while keeping identical semantics.
+    return (
+        xml_string.replace("&amp;", "&")
+        .replace("&lt;", "<")
+        .replace("&gt;", ">")
+        .replace("&apos;", "'")
+        .replace("&quot;", '"')
+    )
 
 
 def to_snake(text: str) -> str:
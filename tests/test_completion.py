@@ -47,6 +47,9 @@ def test_completion_clone() -> None:
     assert clone.generated == original.generated
     assert clone.metadata == original.metadata
 
+    clone.metadata["key"] = "updated"
+    assert original.metadata["key"] == "value"
+
     clone_2 = original.clone(only_messages=True)
     assert clone.metadata != clone_2.metadata
 
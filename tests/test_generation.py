@@ -8,7 +8,7 @@ from rigging import Message
 from rigging.error import ExhaustedMaxRoundsError
 from rigging.generator import GenerateParams, Generator
 from rigging.generator.base import GeneratedMessage, GeneratedText
-from rigging.model import YesNoAnswer
+from rigging.model import Answer, YesNoAnswer
 from rigging.parsing import try_parse
 
 
@@ -135,6 +135,18 @@ async def test_completion_until_parsed_as_with_reset() -> None:
     assert try_parse(completion.generated, YesNoAnswer) is not None
 
 
+@pytest.mark.asyncio
+async def test_completion_until_parsed_as_enforced_after_clone() -> None:
+    generator = FixedGenerator(model="fixed", params=GenerateParams(), text="<yes-no-answer>yes</yes-no-answer>")
+
+    pipeline = generator.complete("original").until_parsed_as(YesNoAnswer)
+    completion = await pipeline.run()
+    assert try_parse(completion.generated, YesNoAnswer) is not None
+
+    with pytest.raises(ExhaustedMaxRoundsError):
+        await pipeline.clone().until_parsed_as(Answer).run()
+
+
 @pytest.mark.parametrize("attempt_recovery", [True, False])
 @pytest.mark.asyncio
 async def test_chat_run_allowed_failed(attempt_recovery: bool) -> None: